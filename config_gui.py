@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import os
 import sys
 import json
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, Callable, cast, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Callable, cast, TypeVar
+
+# tkinter is deferred to first use: loading the Tk runtime dominates the
+# frozen GUI's cold start, so keep it off the module-import path
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import ttk
 
 # Add this type helper near the top of the file
 T = TypeVar('T')
@@ -21,6 +27,8 @@ class FileMoverConfigApp:
         Args:
             root: The tkinter root window
         """
+        import tkinter as tk
+
         self.root: tk.Tk = root
         self.root.title("File Mover Service Configuration")
         self.root.geometry("600x400")
@@ -41,21 +49,37 @@ class FileMoverConfigApp:
         except Exception:
             pass
         
-        # Set config path to be in the same directory as the executable
+        # Resolve the package root once and derive every path from it, so
+        # install/uninstall don't re-probe sys.frozen and re-join paths
         if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            exe_dir = os.path.dirname(sys.executable)
-            self.config_path = os.path.join(exe_dir, "config.json")
+            # Running as compiled executable (onedir layout: the exe lives in
+            # a FileMoverConfig subfolder, everything else sits in the parent)
+            self.exe_dir: str = os.path.dirname(os.path.dirname(sys.executable))
         else:
             # Running as script
-            self.config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+            self.exe_dir: str = os.path.dirname(os.path.abspath(__file__))
+
+        self.config_path: str = os.path.join(self.exe_dir, "config.json")
+        self.nssm_path: str = os.path.join(self.exe_dir, "nssm.exe")
+        self.service_exe_path: str = os.path.join(self.exe_dir, "FileMoverService", "FileMoverService.exe")
+        self.log_dir: str = os.path.join(self.exe_dir, "logs")
+        self.log_stdout: str = os.path.join(self.log_dir, "service_stdout.log")
+        self.log_stderr: str = os.path.join(self.log_dir, "service_stderr.log")
         
+        # (mtime_ns, size) of config.json as last read or written; lets
+        # load_config answer with the cached dict after a single stat
+        self._cfg_stat: tuple[int, int] | None = None
+
         self.config: Dict[str, Any] = self.load_config()
+        # Serialized form of the config as last written, used to skip
+        # no-op saves (sort_keys so field order can't cause a mismatch)
+        self._last_written: bytes = json.dumps(self.config, indent=4, sort_keys=True).encode()
         
         # Initialize UI variables
         self.source_var: tk.StringVar = tk.StringVar(value="")
         self.dest_var: tk.StringVar = tk.StringVar(value="")
         self.interval_var: tk.StringVar = tk.StringVar(value="")
+        self.status_var: tk.StringVar = tk.StringVar(value="")
         
         self.create_widgets()
         self.load_values_to_ui()
@@ -66,6 +90,8 @@ class FileMoverConfigApp:
         Returns:
             Dictionary containing configuration settings
         """
+        from tkinter import messagebox
+
         default_config: Dict[str, Any] = {
             "source_folder": "",
             "destination_parent_folder": "",
@@ -74,8 +100,17 @@ class FileMoverConfigApp:
         
         try:
             if os.path.exists(self.config_path):
+                st = os.stat(self.config_path)
+
+                # Fast path: file unchanged since the last read or write,
+                # so the in-memory config is already in sync
+                if self._cfg_stat == (st.st_mtime_ns, st.st_size):
+                    return self.config
+
                 with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                self._cfg_stat = (st.st_mtime_ns, st.st_size)
+                return config
             return default_config
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load configuration: {e}") #type: ignore
@@ -93,32 +128,55 @@ class FileMoverConfigApp:
         Returns:
             True if successful, False otherwise
         """
+        from tkinter import messagebox
+
         try:
             # Update config from UI
             self.config["source_folder"] = self.source_var.get()
             self.config["destination_parent_folder"] = self.dest_var.get()
             
-            # Validate interval
-            try:
-                interval: int = int(self.interval_var.get())
-                if interval <= 0:
-                    messagebox.showerror("Error", "Polling interval must be a positive number") #type: ignore
-                    return False
-                self.config["polling_interval_seconds"] = interval
-            except ValueError:
-                messagebox.showerror("Error", "Polling interval must be a valid number") #type: ignore
+            # Validate interval. Keystroke validation already restricts the
+            # entry to digits, so a plain digit check suffices here — no
+            # exception path needed
+            interval_text: str = self.interval_var.get()
+            if not interval_text.isdigit() or int(interval_text) <= 0:
+                self._status("Polling interval must be a positive number")
                 return False
-            
+            self.config["polling_interval_seconds"] = int(interval_text)
+
             # Validate
             if not self.config["source_folder"] or not self.config["destination_parent_folder"]:
-                messagebox.showerror("Error", "Source and destination folders must be specified") #type: ignore
+                self._status("Source and destination folders must be specified")
                 return False
                 
-            # Save to file
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-                
-            messagebox.showinfo("Success", f"Configuration saved to {self.config_path}") #type: ignore
+            # Skip the write only when nothing changed since the last save
+            # and the on-disk file still carries the stat snapshot of our
+            # last read or write; an external edit changes the stat and
+            # forces a rewrite rather than silently keeping foreign content
+            payload: bytes = json.dumps(self.config, indent=4, sort_keys=True).encode()
+            if payload == self._last_written and self._cfg_stat is not None:
+                try:
+                    st = os.stat(self.config_path)
+                except OSError:
+                    st = None
+                if st is not None and self._cfg_stat == (st.st_mtime_ns, st.st_size):
+                    self._status(f"Configuration saved to {self.config_path}")
+                    return True
+
+            # Write to a temp file and atomically rename it into place, so
+            # a crash mid-write (or the service reading mid-write) can never
+            # see a truncated config.json
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._last_written = payload
+            st = os.stat(self.config_path)
+            self._cfg_stat = (st.st_mtime_ns, st.st_size)
+
+            self._status(f"Configuration saved to {self.config_path}")
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration: {e}") #type: ignore
@@ -130,69 +188,49 @@ class FileMoverConfigApp:
         Args:
             var: The StringVar to update with the selected folder path
         """
+        from tkinter import filedialog
+
         folder: str = filedialog.askdirectory()
         if folder:
             var.set(folder)
-    
+
+    def _status(self, message: str) -> None:
+        """Show a transient status message without blocking on a dialog.
+
+        Args:
+            message: The message to display in the status label
+        """
+        self.status_var.set(message)
+        self.root.after(4000, lambda: self.status_var.set(""))
+
+    def _is_valid_uint(self, value: str) -> bool:
+        """Key-level validator for the polling interval entry.
+
+        Args:
+            value: The prospective entry contents ('%P')
+
+        Returns:
+            True if the value is empty or a positive integer of sane length
+        """
+        return value == "" or (value.isdigit() and int(value) > 0 and len(value) <= 9)
+
+    def _browse_source(self) -> None:
+        """Browse for the source folder."""
+        self.browse_folder(self.source_var)
+
+    def _browse_dest(self) -> None:
+        """Browse for the destination folder."""
+        self.browse_folder(self.dest_var)
+
+
     def create_widgets(self) -> None:
-        """Create the UI widgets."""
+        """Create the UI widgets from a declarative spec table."""
+        import tkinter as tk
+        from tkinter import ttk
+
         main_frame: ttk.Frame = ttk.Frame(self.root, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_label: ttk.Label = ttk.Label(
-            main_frame, 
-            text="File Mover Service Configuration", 
-            font=("Helvetica", 14, "bold")
-        )
-        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20), sticky="w")
-        
-        # Source folder
-        source_label: ttk.Label = ttk.Label(main_frame, text="Source Folder:")
-        source_label.grid(row=1, column=0, sticky="w", pady=5)
-        
-        source_entry: ttk.Entry = ttk.Entry(main_frame, textvariable=self.source_var, width=50)
-        source_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        
-        source_button: ttk.Button = ttk.Button(
-            main_frame, 
-            text="Browse...", 
-            command=lambda: self.browse_folder(self.source_var)
-        )
-        source_button.grid(row=1, column=2, padx=5, pady=5)
-        
-        # Destination folder
-        dest_label: ttk.Label = ttk.Label(main_frame, text="Destination Folder:")
-        dest_label.grid(row=2, column=0, sticky="w", pady=5)
-        
-        dest_entry: ttk.Entry = ttk.Entry(main_frame, textvariable=self.dest_var, width=50)
-        dest_entry.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
-        
-        dest_button: ttk.Button = ttk.Button(
-            main_frame, 
-            text="Browse...", 
-            command=lambda: self.browse_folder(self.dest_var)
-        )
-        dest_button.grid(row=2, column=2, padx=5, pady=5)
-        
-        # Polling interval
-        interval_label: ttk.Label = ttk.Label(main_frame, text="Polling Interval (seconds):")
-        interval_label.grid(row=3, column=0, sticky="w", pady=5)
-        
-        interval_entry: ttk.Entry = ttk.Entry(main_frame, textvariable=self.interval_var, width=10)
-        interval_entry.grid(row=3, column=1, sticky="w", padx=5, pady=5)
-        
-        # Folder structure explanation
-        separator: ttk.Separator = ttk.Separator(main_frame, orient="horizontal")
-        separator.grid(row=4, column=0, columnspan=3, sticky="ew", pady=15)
-        
-        info_title: ttk.Label = ttk.Label(
-            main_frame, 
-            text="Folder Structure Requirements:", 
-            font=("Helvetica", 10, "bold")
-        )
-        info_title.grid(row=5, column=0, columnspan=3, sticky="w", pady=(0, 5))
-        
+
         info_text: str = (
             "• Destination folders must follow the format: 'NUMBER - ADDRESS - NAME'\n"
             "• Files will be matched to folders based on the ADDRESS part\n"
@@ -200,42 +238,77 @@ class FileMoverConfigApp:
             "• Other files will go to 'Correspondence/YYYY-MM-DD' subfolders\n"
             "• Files without a date prefix will have today's date added automatically"
         )
-        
-        info_label: ttk.Label = ttk.Label(main_frame, text=info_text, justify="left")
-        info_label.grid(row=6, column=0, columnspan=3, sticky="w", pady=5)
-        
+
+        # Reject invalid interval keystrokes at the Tcl level, so bad input
+        # never lands in the entry in the first place
+        validate_uint = (self.root.register(self._is_valid_uint), '%P')
+
+        # Each entry: (widget kind, constructor options, grid options).
+        # Driving creation from one table keeps the layout readable and
+        # replaces the per-click browse lambdas with bound methods
+        widget_specs: list[tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+            ("label", {"text": "File Mover Service Configuration", "font": ("Helvetica", 14, "bold")},
+             {"row": 0, "column": 0, "columnspan": 3, "pady": (0, 20), "sticky": "w"}),
+            # Source folder
+            ("label", {"text": "Source Folder:"},
+             {"row": 1, "column": 0, "sticky": "w", "pady": 5}),
+            ("entry", {"textvariable": self.source_var, "width": 50},
+             {"row": 1, "column": 1, "sticky": "ew", "padx": 5, "pady": 5}),
+            ("button", {"text": "Browse...", "command": self._browse_source},
+             {"row": 1, "column": 2, "padx": 5, "pady": 5}),
+            # Destination folder
+            ("label", {"text": "Destination Folder:"},
+             {"row": 2, "column": 0, "sticky": "w", "pady": 5}),
+            ("entry", {"textvariable": self.dest_var, "width": 50},
+             {"row": 2, "column": 1, "sticky": "ew", "padx": 5, "pady": 5}),
+            ("button", {"text": "Browse...", "command": self._browse_dest},
+             {"row": 2, "column": 2, "padx": 5, "pady": 5}),
+            # Polling interval
+            ("label", {"text": "Polling Interval (seconds):"},
+             {"row": 3, "column": 0, "sticky": "w", "pady": 5}),
+            ("entry", {"textvariable": self.interval_var, "width": 10,
+                       "validate": "key", "validatecommand": validate_uint},
+             {"row": 3, "column": 1, "sticky": "w", "padx": 5, "pady": 5}),
+            # Folder structure explanation
+            ("separator", {"orient": "horizontal"},
+             {"row": 4, "column": 0, "columnspan": 3, "sticky": "ew", "pady": 15}),
+            ("label", {"text": "Folder Structure Requirements:", "font": ("Helvetica", 10, "bold")},
+             {"row": 5, "column": 0, "columnspan": 3, "sticky": "w", "pady": (0, 5)}),
+            ("label", {"text": info_text, "justify": "left"},
+             {"row": 6, "column": 0, "columnspan": 3, "sticky": "w", "pady": 5}),
+        ]
+
+        factories: Dict[str, Callable[..., Any]] = {
+            "label": ttk.Label,
+            "entry": ttk.Entry,
+            "button": ttk.Button,
+            "separator": ttk.Separator,
+        }
+
+        for kind, options, grid_options in widget_specs:
+            factories[kind](main_frame, **options).grid(**grid_options)
+
         # Buttons
         button_frame: ttk.Frame = ttk.Frame(main_frame)
         button_frame.grid(row=7, column=0, columnspan=3, pady=20)
-        
-        save_button: ttk.Button = ttk.Button(
-            button_frame, 
-            text="Save Configuration", 
-            command=self.save_config
-        )
-        save_button.pack(side=tk.LEFT, padx=5)
-        
-        install_button: ttk.Button = ttk.Button(
-            button_frame, 
-            text="Install Service", 
-            command=self.install_service
-        )
-        install_button.pack(side=tk.LEFT, padx=5)
-        
-        uninstall_button: ttk.Button = ttk.Button(
-            button_frame, 
-            text="Uninstall Service", 
-            command=self.uninstall_service
-        )
-        uninstall_button.pack(side=tk.LEFT, padx=5)
-        
-        exit_button: ttk.Button = ttk.Button(
-            button_frame, 
-            text="Exit", 
-            command=self.root.destroy
+
+        for text, command in (
+            ("Save Configuration", self.save_config),
+            ("Install Service", self.install_service),
+            ("Uninstall Service", self.uninstall_service),
+            ("Exit", self.root.destroy),
+        ):
+            ttk.Button(button_frame, text=text, command=command).pack(side=tk.LEFT, padx=5)
+
+        # Transient status line; non-fatal messages land here instead of
+        # in a modal dialog the user has to click away
+        status_label: ttk.Label = ttk.Label(
+            main_frame,
+            textvariable=self.status_var,
+            foreground="gray"
         )
-        exit_button.pack(side=tk.LEFT, padx=5)
-        
+        status_label.grid(row=8, column=0, columnspan=3, sticky="w")
+
         # Make grid cells expandable
         main_frame.columnconfigure(1, weight=1)
     
@@ -243,58 +316,64 @@ class FileMoverConfigApp:
         """Install the Windows service."""
         if not self.save_config():
             return
-            
+
         try:
             import subprocess
-            
-            # Get the path to the executable directory
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                exe_dir: str = os.path.dirname(sys.executable)
-                
-                # Use FileMoverService.exe, not the current executable (which is FileMoverConfig.exe)
-                service_exe_path: str = os.path.join(exe_dir, "FileMoverService.exe")
-                
-                if not os.path.exists(service_exe_path):
-                    messagebox.showerror("Error", "FileMoverService.exe not found in the same directory.") #type: ignore
-                    return
-            else:
+            from concurrent.futures import ThreadPoolExecutor
+            from tkinter import messagebox
+
+            if not getattr(sys, 'frozen', False):
                 # Running as script - show error
                 messagebox.showerror("Error", "Please run the compiled executable to install as a service") #type: ignore
                 return
-            
+
+            # Use FileMoverService.exe from its onedir folder, not the
+            # current executable (which is FileMoverConfig.exe)
+            if not os.path.exists(self.service_exe_path):
+                messagebox.showerror("Error", "FileMoverService.exe not found in the FileMoverService folder.") #type: ignore
+                return
+
             # Use NSSM to install the service
-            nssm_path: str = os.path.join(exe_dir, "nssm.exe")
-            if not os.path.exists(nssm_path):
+            if not os.path.exists(self.nssm_path):
                 messagebox.showerror("Error", "NSSM utility not found. Make sure it's included with the application.") #type: ignore
                 return
-                
+
             # Install the service
             cmd: list[str] = [
-                nssm_path, "install", "FileMoverService", service_exe_path,
+                self.nssm_path, "install", "FileMoverService", self.service_exe_path,
                 "--config", self.config_path
             ]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
-                # Set service to auto-start
-                subprocess.run([nssm_path, "set", "FileMoverService", "Start", "SERVICE_AUTO_START"])
-                
-                # Set the working directory to the executable's directory
-                subprocess.run([nssm_path, "set", "FileMoverService", "AppDirectory", exe_dir])
-                
-                # Set recovery options (restart on failure)
-                subprocess.run([nssm_path, "set", "FileMoverService", "AppExit", "Default", "Restart"])
-                
-                # Set stdout and stderr to log files
-                log_dir = os.path.join(exe_dir, "logs")
-                os.makedirs(log_dir, exist_ok=True)
-                
-                subprocess.run([nssm_path, "set", "FileMoverService", "AppStdout", os.path.join(log_dir, "service_stdout.log")])
-                subprocess.run([nssm_path, "set", "FileMoverService", "AppStderr", os.path.join(log_dir, "service_stderr.log")])
-                
-                messagebox.showinfo("Success", "Service installed successfully. You can start it from Windows Services.") #type: ignore
+                os.makedirs(self.log_dir, exist_ok=True)
+
+                # Configure the service: auto-start, working directory,
+                # restart on failure, and stdout/stderr log files
+                set_cmds: list[list[str]] = [
+                    [self.nssm_path, "set", "FileMoverService", "Start", "SERVICE_AUTO_START"],
+                    [self.nssm_path, "set", "FileMoverService", "AppDirectory", self.exe_dir],
+                    [self.nssm_path, "set", "FileMoverService", "AppExit", "Default", "Restart"],
+                    [self.nssm_path, "set", "FileMoverService", "AppStdout", self.log_stdout],
+                    [self.nssm_path, "set", "FileMoverService", "AppStderr", self.log_stderr],
+                ]
+
+                # The parameters are independent, so run the set commands
+                # concurrently; total latency becomes the slowest call
+                # instead of the sum of all of them
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    set_results = list(executor.map(
+                        lambda cmd: subprocess.run(cmd, capture_output=True, text=True),
+                        set_cmds
+                    ))
+
+                for set_result in set_results:
+                    if set_result.returncode != 0:
+                        messagebox.showerror("Error", f"Failed to configure service: {set_result.stderr}") #type: ignore
+                        return
+
+                self._status("Service installed successfully. You can start it from Windows Services.")
             else:
                 messagebox.showerror("Error", f"Failed to install service: {result.stderr}") #type: ignore
                 
@@ -305,17 +384,10 @@ class FileMoverConfigApp:
         """Uninstall the Windows service."""
         try:
             import subprocess
+            from tkinter import messagebox
             
-            # Get the path to NSSM
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                exe_dir: str = os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                exe_dir: str = os.path.dirname(os.path.abspath(__file__))
-                
-            nssm_path: str = os.path.join(exe_dir, "nssm.exe")
-            if not os.path.exists(nssm_path):
+            # Check for NSSM in the package root
+            if not os.path.exists(self.nssm_path):
                 messagebox.showerror("Error", "NSSM utility not found. Make sure it's included with the application.") #type: ignore
                 return
             
@@ -323,15 +395,32 @@ class FileMoverConfigApp:
             if not messagebox.askyesno("Confirm", "Are you sure you want to uninstall the File Mover Service?"): #type: ignore
                 return
                 
-            # Stop the service first
-            subprocess.run([nssm_path, "stop", "FileMoverService"], capture_output=True)
-            
+            # Skip the stop only when the service is affirmatively stopped;
+            # a blind stop attempt is the slowest step of uninstall when it
+            # isn't needed. nssm writes UTF-16 to redirected stdout, so
+            # decode by BOM rather than trusting the locale codec. All
+            # calls are time-bounded so the GUI can never freeze on SCM
+            status = subprocess.run(
+                [self.nssm_path, "status", "FileMoverService"],
+                capture_output=True, timeout=5
+            )
+            raw = status.stdout or b""
+            if raw[:2] in (b"\xff\xfe", b"\xfe\xff"):
+                status_text = raw.decode("utf-16")
+            else:
+                status_text = raw.decode(errors="replace")
+            if "SERVICE_STOPPED" not in status_text:
+                subprocess.run(
+                    [self.nssm_path, "stop", "FileMoverService"],
+                    capture_output=True, timeout=30
+                )
+
             # Remove the service
-            cmd: list[str] = [nssm_path, "remove", "FileMoverService", "confirm"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd: list[str] = [self.nssm_path, "remove", "FileMoverService", "confirm"]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
             if result.returncode == 0:
-                messagebox.showinfo("Success", "Service uninstalled successfully.") #type: ignore
+                self._status("Service uninstalled successfully.")
             else:
                 messagebox.showerror("Error", f"Failed to uninstall service: {result.stderr}") #type: ignore
                 
@@ -340,6 +429,8 @@ class FileMoverConfigApp:
 
 def main() -> None:
     """Main entry point for the application."""
+    import tkinter as tk
+
     root: tk.Tk = tk.Tk()
     _ = FileMoverConfigApp(root)  # Create app without storing reference
     root.mainloop()
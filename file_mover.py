@@ -1,17 +1,93 @@
 #!/usr/bin/env python3
+import asyncio
 import json
 import os
 import re
 import shutil
 import datetime
+import threading
 import time
 import signal
 import sys
-from typing import Dict, Any, Optional, Pattern
+from typing import Dict, Any, List, Optional, Set, Tuple
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+try:
+    # Optional Linux fast path: raw getdents64 skips the per-entry object
+    # overhead of scandir on directories with tens of thousands of files
+    from getdents import getdents, DT_REG  # type: ignore
+except ImportError:
+    getdents = None
+
+try:
+    # Optional: compiled Aho-Corasick automaton scans a filename once for
+    # every subfolder keyword, however many are configured
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: orjson parses JSON several times faster than the stdlib,
+    # which matters if the config grows or gets reloaded on change
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional: filesystem events wake the service the moment files arrive
+    # instead of waiting out the polling interval
+    from watchdog.observers import Observer  # type: ignore
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = None
+
+
+if FileSystemEventHandler is not None:
+    class _SourceFolderWatcher(FileSystemEventHandler):  # type: ignore[misc]
+        """Wakes the service loop when files land in the source folder."""
+
+        def __init__(self, wake: threading.Event) -> None:
+            self._wake = wake
+
+        def on_created(self, event: Any) -> None:
+            self._wake.set()
+
+        def on_moved(self, event: Any) -> None:
+            self._wake.set()
+
+
+# Folder lookup structures: an exact-match dict keyed by lowercase address
+# plus parallel key/path lists. Folder paths are kept as strings so the
+# per-file hot path never rebuilds Path objects
+FolderLookup = Tuple[Dict[str, str], List[str], List[str]]
+
+# Fused pattern for "date - address - rest" filenames: an optional
+# YYYY-MM-DD prefix, then the address, then anything after the next
+# " - " separator. Verifying and capturing in one anchored match keeps
+# the per-file work in C instead of a split plus per-part stripping
+_EXTRACT_RE = re.compile(r'^(?:\d{4}-\d{2}-\d{2} - )?(.+?)(?: - .*)?$')
+
+
+def _has_date_prefix(s: str) -> bool:
+    """Check whether a string starts with a YYYY-MM-DD shaped date.
+
+    Equivalent to matching ^\\d{4}-\\d{2}-\\d{2}, but a fixed-shape
+    prefix test doesn't need the regex engine at all.
+
+    Args:
+        s: The string to check
+
+    Returns:
+        True if the first ten characters have the date shape
+    """
+    return (len(s) >= 10 and s[4] == '-' and s[7] == '-'
+            and s[0:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit())
+
 
 class FileMoverService:
     def __init__(self, config_path: str) -> None:
@@ -27,57 +103,99 @@ class FileMoverService:
             self.config: Dict[str, Any] = self._load_config(config_path)
             self.source_folder: Path = Path(self.config["source_folder"])
             self.destination_parent: Path = Path(self.config["destination_parent_folder"])
-            
-            # Compile regex for date pattern (YYYY-MM-DD)
-            # Make the pattern more specific to match valid dates
-            self.date_pattern: Pattern[str] = re.compile(r'^(20\d{2}|19\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$')
-            
+
+            # Keyword -> subfolder routing, configurable via
+            # "subfolder_keywords" and defaulting to the Banks Fee Letter
+            # rule; keywords are lowercased once here
+            keyword_map: Dict[str, str] = self.config.get(
+                "subfolder_keywords", {"Banks Fee Letter": "Contracts"})
+            self._subfolder_keywords: List[Tuple[str, str]] = [
+                (keyword.lower(), subfolder) for keyword, subfolder in keyword_map.items()]
+
+            self._subfolder_matcher = None
+            if ahocorasick is not None:
+                self._subfolder_matcher = ahocorasick.Automaton()
+                for keyword_lower, subfolder in self._subfolder_keywords:
+                    self._subfolder_matcher.add_word(keyword_lower, subfolder)
+                self._subfolder_matcher.make_automaton()
+
             # Validate folders exist
             self._validate_folders()
-            
-            # Flag to control service loop
+
+            # Detect once whether source and destination share a
+            # filesystem; if so every move is a single atomic rename
+            try:
+                self._same_fs: bool = (os.stat(self.source_folder).st_dev
+                                       == os.stat(self.destination_parent).st_dev)
+            except OSError:
+                self._same_fs = False
+
+            # Flag to control service loop; the event lets the sleep in
+            # run_service_loop return the moment a shutdown signal arrives
             self.running = True
+            self._stop_event = threading.Event()
+            # Set by the filesystem watcher when files arrive and by the
+            # shutdown handler, so the observer-backed sleep never outlives
+            # either; cleared at the top of each cycle
+            self._wake_event = threading.Event()
+
+            # Serializes the duplicate probe and rename per destination
+            # directory so concurrent moves can't race onto the same name
+            self._dest_locks: Dict[str, threading.Lock] = {}
+            self._dest_locks_guard = threading.Lock()
+
+            # Directory mtime snapshots; an unchanged mtime lets a cycle
+            # skip the scan (source) or reuse the folder lookup (destination)
+            self._last_source_mtime: int = 0
+            self._last_dest_mtime: int = 0
+            self._folder_lookup_cache: Optional[FolderLookup] = None
             
         except Exception as e:
-            self.logger.error(f"Initialization error: {e}")
+            self.logger.error("Initialization error: %s", e)
             raise
 
     def _setup_logging(self) -> None:
-        """Set up logging configuration with rotation."""
+        """Set up logging with rotation, written from a background thread."""
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        
+
         log_file = log_dir / "file_mover.log"
-        
+
         # Set up a rotating file handler (10 MB max size, keep 5 backup files)
         handler = RotatingFileHandler(
-            log_file, 
+            log_file,
             maxBytes=10*1024*1024,  # 10 MB
             backupCount=5
         )
-        
+
         console_handler = logging.StreamHandler()
-        
+
+        # Route records through a queue so the hot path never blocks on
+        # disk writes; a listener thread drains it to the real handlers
+        log_queue: queue.Queue[Any] = queue.Queue(-1)
+        self._log_listener = QueueListener(log_queue, handler, console_handler)
+        self._log_listener.start()
+
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[handler, console_handler]
+            handlers=[QueueHandler(log_queue)]
         )
-        
+
         self.logger = logging.getLogger("FileMoverService")
 
     def _validate_folders(self) -> None:
         """Validate that source and destination folders exist."""
         if not self.source_folder.exists():
-            self.logger.error(f"Source folder not found: {self.source_folder}")
+            self.logger.error("Source folder not found: %s", self.source_folder)
             raise FileNotFoundError(f"Source folder not found: {self.source_folder}")
         
         if not self.destination_parent.exists():
-            self.logger.error(f"Destination parent folder not found: {self.destination_parent}")
+            self.logger.error("Destination parent folder not found: %s", self.destination_parent)
             raise FileNotFoundError(f"Destination parent folder not found: {self.destination_parent}")
         
-        self.logger.info(f"Source folder: {self.source_folder}")
-        self.logger.info(f"Destination parent folder: {self.destination_parent}")
+        self.logger.info("Source folder: %s", self.source_folder)
+        self.logger.info("Destination parent folder: %s", self.destination_parent)
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file.
@@ -89,18 +207,19 @@ class FileMoverService:
             Dictionary containing configuration settings
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                self.logger.info(f"Loaded configuration from {config_path}")
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
+                self.logger.info("Loaded configuration from %s", config_path)
                 return config
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in configuration file: {e}")
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+            self.logger.error("Invalid JSON in configuration file: %s", e)
             raise Exception(f"Invalid JSON in configuration file: {e}")
         except FileNotFoundError:
-            self.logger.error(f"Configuration file not found: {config_path}")
+            self.logger.error("Configuration file not found: %s", config_path)
             raise Exception(f"Configuration file not found: {config_path}")
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            self.logger.error("Error loading configuration: %s", e)
             raise Exception(f"Error loading configuration: {e}")
 
     def extract_address(self, filename: str) -> Optional[str]:
@@ -118,21 +237,31 @@ class FileMoverService:
                 return None
             
             # Remove file extension
-            name_without_ext = os.path.splitext(filename)[0]
-            
-            # Split by " - " (space-dash-space) to properly separate parts
-            parts = [part.strip() for part in name_without_ext.split(" - ")]
-            
-            # Filter out empty parts
-            parts = [p for p in parts if p]
+            name_without_ext = filename.rpartition('.')[0] or filename
+
+            match = _EXTRACT_RE.match(name_without_ext)
+            if match:
+                raw = match.group(1)
+                address = raw.strip()
+                # Only trust the fast path when the capture is already
+                # clean. Whitespace means a separator didn't match exactly
+                # (e.g. a double space after the date prefix, which leaves
+                # the date in the capture), and dash junk means an empty
+                # part; both go through the slow path, which strips and
+                # drops those pieces the way the split always did
+                if address and raw == address and address == address.strip('- '):
+                    return address
+
+            # Fallback for pathological names the regex rejects: split by
+            # " - " (space-dash-space), strip and drop empty parts
+            # in a single pass
+            parts = [p for p in (s.strip() for s in name_without_ext.split(" - ")) if p]
             
             if not parts:
                 return None
             
-            # Check if first part looks like a date (YYYY-MM-DD)
-            date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-            
-            if len(parts) >= 2 and date_pattern.match(parts[0]):
+            # Check if first part is exactly a date (YYYY-MM-DD)
+            if len(parts) >= 2 and len(parts[0]) == 10 and _has_date_prefix(parts[0]):
                 # If first part is a date, return the second part as the address
                 return parts[1]
             
@@ -140,7 +269,7 @@ class FileMoverService:
             return parts[0]
         
         except Exception as e:
-            self.logger.error(f"Error extracting address from {filename}: {e}")
+            self.logger.error("Error extracting address from %s: %s", filename, e)
             return None
 
     def find_matching_folder(self, address: str) -> Optional[Path]:
@@ -154,43 +283,45 @@ class FileMoverService:
         """
         try:
             address_lower = address.lower()
-            
-            for folder in self.destination_parent.iterdir():
-                if folder.is_dir():
-                    folder_parts = folder.name.split('-')
-                    if len(folder_parts) >= 2:
-                        folder_address = folder_parts[1].strip().lower()
-                        # Check if addresses match (allowing for some flexibility)
-                        if folder_address in address_lower or address_lower in folder_address:
-                            return folder
-            
+
+            # scandir reuses the file-type bits from the directory listing,
+            # avoiding an extra stat per entry
+            with os.scandir(self.destination_parent) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folder_parts = entry.name.split('-')
+                        if len(folder_parts) >= 2:
+                            folder_address = folder_parts[1].strip().lower()
+                            # Check if addresses match (allowing for some flexibility)
+                            if folder_address in address_lower or address_lower in folder_address:
+                                return Path(entry.path)
+
             return None
         except Exception as e:
-            self.logger.error(f"Error finding matching folder for address '{address}': {e}")
+            self.logger.error("Error finding matching folder for address '%s': %s", address, e)
             return None
 
-    def ensure_date_in_filename(self, filename: str) -> str:
+    def ensure_date_in_filename(self, filename: str, today: Optional[str] = None) -> str:
         """Ensure filename has a date prefix (YYYY-MM-DD).
-        
+
         Args:
             filename: The original filename
-            
+            today: Today's date as YYYY-MM-DD, computed if not given
+
         Returns:
             Filename with date prefix
         """
         try:
-            # Simple date pattern check
-            date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}')
-            
             # Check if filename already starts with a date
-            if date_pattern.match(filename):
+            if _has_date_prefix(filename):
                 return filename
-            
+
             # Add today's date to the filename
-            today = datetime.date.today().strftime("%Y-%m-%d")
+            if today is None:
+                today = datetime.date.today().strftime("%Y-%m-%d")
             return f"{today} - {filename}"
         except Exception as e:
-            self.logger.error(f"Error ensuring date in filename {filename}: {e}")
+            self.logger.error("Error ensuring date in filename %s: %s", filename, e)
             return filename  # Return original filename if there's an error
 
     def handle_duplicate_file(self, destination_path: Path) -> Path:
@@ -208,165 +339,336 @@ class FileMoverService:
         base_name = destination_path.stem
         extension = destination_path.suffix
         parent_dir = destination_path.parent
-        
+
+        def taken(counter: int) -> bool:
+            return (parent_dir / f"{base_name}_{counter}{extension}").exists()
+
+        # Exponential probe: double the counter until a free slot appears,
+        # so N existing duplicates cost O(log N) stats instead of O(N)
         counter = 1
-        while True:
-            new_path = parent_dir / f"{base_name}_{counter}{extension}"
-            if not new_path.exists():
-                return new_path
-            counter += 1
+        while taken(counter):
+            counter *= 2
+
+        if counter == 1:
+            return parent_dir / f"{base_name}_1{extension}"
+
+        # Binary search between the last taken and the first free counter;
+        # duplicate suffixes are assigned contiguously, so the boundary is
+        # the smallest free index
+        low, high = counter // 2, counter
+        while high - low > 1:
+            mid = (low + high) // 2
+            if taken(mid):
+                low = mid
+            else:
+                high = mid
+
+        return parent_dir / f"{base_name}_{high}{extension}"
+
+    def _ensure_dir(self, directory: str, created_dirs: Optional[Set[str]] = None) -> None:
+        """Create a directory, skipping the syscall if this cycle already did.
+
+        Args:
+            directory: The directory to create
+            created_dirs: Set of directories already created this cycle
+        """
+        if created_dirs is not None and directory in created_dirs:
+            return
+        os.makedirs(directory, exist_ok=True)
+        if created_dirs is not None:
+            created_dirs.add(directory)
+
+    def _match_subfolder(self, filename_lower: str) -> Optional[str]:
+        """Find the subfolder for the first configured keyword in a filename.
+
+        Args:
+            filename_lower: The filename, already lowercased
+
+        Returns:
+            The subfolder name, or None for the default Correspondence flow
+        """
+        if self._subfolder_matcher is not None:
+            # Single pass over the filename regardless of keyword count
+            for _end, subfolder in self._subfolder_matcher.iter(filename_lower):
+                return subfolder
+            return None
+
+        for keyword_lower, subfolder in self._subfolder_keywords:
+            if keyword_lower in filename_lower:
+                return subfolder
+        return None
+
+    def _move(self, src: Path, dst: str) -> None:
+        """Move a file, using a plain rename when the folders share a filesystem.
+
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        if self._same_fs:
+            # Single atomic syscall; skips shutil.move's Python dispatch
+            os.replace(src, dst)
+        else:
+            shutil.move(str(src), dst)
+
+    def _dest_lock(self, directory: str) -> threading.Lock:
+        """Return the lock serializing moves into the given directory.
+
+        Args:
+            directory: Destination directory path string
+        """
+        with self._dest_locks_guard:
+            lock = self._dest_locks.get(directory)
+            if lock is None:
+                lock = self._dest_locks[directory] = threading.Lock()
+            return lock
 
-    def move_file(self, file_path: Path, folder_lookup: Dict[str, Path]) -> None:
+    def move_file(self, file_path: Path, folder_lookup: FolderLookup,
+                  today_str: Optional[str] = None,
+                  created_dirs: Optional[Set[str]] = None) -> bool:
         """Move a file to the appropriate destination subfolder.
-        
+
         Args:
             file_path: Path to the file to be moved
-            folder_lookup: Dictionary mapping addresses to folder paths
+            folder_lookup: Lookup structures from _build_folder_lookup
+            today_str: Today's date as YYYY-MM-DD, computed if not given
+            created_dirs: Set of directories already created this cycle
+
+        Returns:
+            True if the file is no longer in the source folder
         """
         try:
-            if not file_path.exists():
-                self.logger.warning(f"File no longer exists: {file_path}")
-                return
-                
+            if today_str is None:
+                today_str = datetime.date.today().strftime("%Y-%m-%d")
+
             original_filename = file_path.name
             
             # Extract address from filename
             address = self.extract_address(original_filename)
             
             if not address:
-                self.logger.warning(f"Could not extract address from {original_filename}, skipping")
-                return
+                self.logger.warning("Could not extract address from %s, skipping", original_filename)
+                return False
             
+            # Lowercase the strings once; both checks below reuse them
+            original_lower = original_filename.lower()
+
             # Find matching folder using the lookup dictionary
-            destination_folder = self._find_matching_folder_from_lookup(address, folder_lookup)
+            destination_folder = self._find_matching_folder_from_lookup(address.lower(), folder_lookup)
             
             if not destination_folder:
-                self.logger.info(f"No matching folder found for address '{address}', skipping file {original_filename}")
-                return
+                self.logger.info("No matching folder found for address '%s', skipping file %s", address, original_filename)
+                return False
             
             # Ensure filename has date
-            new_filename = self.ensure_date_in_filename(original_filename)
+            new_filename = self.ensure_date_in_filename(original_filename, today_str)
             
             # Determine the appropriate subfolder
-            if "Banks Fee Letter".lower() in original_filename.lower():
-                subfolder_name = "Contracts"
-                final_destination = destination_folder / subfolder_name
-                final_destination.mkdir(exist_ok=True)
+            subfolder_name = self._match_subfolder(original_lower)
+            if subfolder_name:
+                final_destination = os.path.join(destination_folder, subfolder_name)
             else:
-                # Default to Correspondence folder
-                correspondence_folder = destination_folder / "Correspondence"
-                correspondence_folder.mkdir(exist_ok=True)
-                
-                # Create date subfolder within Correspondence
-                today_str = datetime.date.today().strftime("%Y-%m-%d")
-                date_subfolder = correspondence_folder / today_str
-                date_subfolder.mkdir(exist_ok=True)
-                
-                final_destination = date_subfolder
-            
+                # Default to a date subfolder within Correspondence
+                final_destination = os.path.join(destination_folder, "Correspondence", today_str)
+
+            # mkdir is memoized per cycle; most files share a destination
+            self._ensure_dir(final_destination, created_dirs)
+
             # Create destination path
-            destination_path = final_destination / new_filename
-            
-            # Handle duplicate files
-            if destination_path.exists():
-                self.logger.info(f"File already exists at {destination_path}")
-                destination_path = self.handle_duplicate_file(destination_path)
-                self.logger.info(f"Using new path: {destination_path}")
-            
-            # Move the file
-            try:
-                shutil.move(str(file_path), str(destination_path))
-                self.logger.info(f"Moved {original_filename} to {destination_path}")
-            except PermissionError:
-                self.logger.warning(f"Permission denied when moving {original_filename}. Waiting and retrying...")
-                time.sleep(1)  # Wait a second and try again
-                shutil.move(str(file_path), str(destination_path))
-                self.logger.info(f"Successfully moved {original_filename} after retry")
-            
+            destination_path = os.path.join(final_destination, new_filename)
+
+            # Two source files can map to the same destination name (e.g.
+            # with and without the date prefix), so the probe-and-rename
+            # must be atomic per directory or concurrent moves could both
+            # pick the same free name and overwrite one another
+            with self._dest_lock(final_destination):
+                # Handle duplicate files
+                if os.path.exists(destination_path):
+                    self.logger.info("File already exists at %s", destination_path)
+                    destination_path = str(self.handle_duplicate_file(Path(destination_path)))
+                    self.logger.info("Using new path: %s", destination_path)
+
+                # Move the file. The move itself reports a vanished source,
+                # so no up-front exists() stat is needed
+                try:
+                    self._move(file_path, destination_path)
+                    self.logger.info("Moved %s to %s", original_filename, destination_path)
+                except FileNotFoundError:
+                    self.logger.warning("File no longer exists: %s", file_path)
+                    return True
+                except PermissionError:
+                    self.logger.warning("Permission denied when moving %s. Waiting and retrying...", original_filename)
+                    time.sleep(1)  # Wait a second and try again
+                    self._move(file_path, destination_path)
+                    self.logger.info("Successfully moved %s after retry", original_filename)
+
+            return True
+
         except Exception as e:
-            self.logger.error(f"Error processing file {file_path}: {e}")
+            self.logger.error("Error processing file %s: %s", file_path, e)
+            return False
 
     def process_files(self) -> None:
         """Process all files in the source folder."""
         try:
-            self.logger.info(f"Starting to process files in {self.source_folder}")
-            
+            # A directory's mtime changes whenever entries are added or
+            # removed, so an unchanged mtime means no new files have arrived
+            # and the whole scan can be skipped. The snapshot is taken before
+            # the scan, and our own moves bump the mtime, so nothing that
+            # lands mid-cycle is ever missed
+            source_mtime = os.stat(self.source_folder).st_mtime_ns
+            if source_mtime == self._last_source_mtime:
+                self.logger.debug("Source folder unchanged since last cycle, skipping scan")
+                return
+
+            self.logger.info("Starting to process files in %s", self.source_folder)
+
             # Build folder lookup dictionary once per polling interval
             folder_lookup = self._build_folder_lookup()
+
+            # Compute today's date once per cycle rather than per file
+            today_str = datetime.date.today().strftime("%Y-%m-%d")
+
+            # Directories created so far this cycle, to skip repeat mkdirs
+            created_dirs: Set[str] = set()
             
             # Get list of files first to avoid modification during iteration
-            files_to_process = [f for f in self.source_folder.iterdir() if f.is_file()]
+            if getdents is not None and sys.platform == 'linux':
+                # Read the directory through getdents64 with a large buffer
+                files_to_process = [self.source_folder / name
+                                    for _inode, entry_type, name in getdents(str(self.source_folder), 1 << 24)
+                                    if entry_type == DT_REG]
+            else:
+                # scandir avoids a stat call per entry, unlike iterdir+is_file
+                with os.scandir(self.source_folder) as entries:
+                    files_to_process = [Path(entry.path) for entry in entries
+                                        if entry.is_file(follow_symlinks=False)]
             
             if not files_to_process:
                 self.logger.info("No files found to process")
+                self._last_source_mtime = source_mtime
                 return
-                
-            self.logger.info(f"Found {len(files_to_process)} files to process")
-            
-            for file_path in files_to_process:
-                try:
-                    self.move_file(file_path, folder_lookup)
-                except Exception as e:
-                    self.logger.error(f"Error moving file {file_path}: {e}")
-                    # Continue with next file
-            
+
+            self.logger.info("Found %d files to process", len(files_to_process))
+
+            # The moves are I/O-bound, so dispatch them concurrently
+            # instead of paying each syscall's latency in turn
+            all_moved = asyncio.run(self._move_files(files_to_process, folder_lookup, today_str, created_dirs))
+
+            # A file left behind (e.g. its address folder doesn't exist yet)
+            # doesn't change the source mtime, so only arm the short-circuit
+            # when the folder was fully drained; otherwise the next cycle
+            # rescans and picks up whatever was skipped
+            if all_moved:
+                self._last_source_mtime = source_mtime
             self.logger.info("Finished processing files")
-            
+
         except Exception as e:
-            self.logger.error(f"Error in process_files: {e}")
+            self.logger.error("Error in process_files: %s", e)
+
+    async def _move_files(self, files_to_process: List[Path],
+                          folder_lookup: FolderLookup,
+                          today_str: str, created_dirs: Set[str]) -> bool:
+        """Move the given files concurrently via a bounded thread pool.
+
+        Args:
+            files_to_process: Files found in the source folder this cycle
+            folder_lookup: Lookup structures from _build_folder_lookup
+            today_str: Today's date as YYYY-MM-DD
+            created_dirs: Set of directories already created this cycle
 
-    def _build_folder_lookup(self) -> Dict[str, Path]:
-        """Build a lookup dictionary for efficient folder matching.
-        
         Returns:
-            Dictionary mapping lowercase address substrings to folder paths
+            True if every file left the source folder
         """
-        folder_lookup: Dict[str, Path] = {}
-        
+        semaphore = asyncio.Semaphore(8)
+
+        async def move_one(file_path: Path) -> bool:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self.move_file, file_path, folder_lookup, today_str, created_dirs)
+                except Exception as e:
+                    self.logger.error("Error moving file %s: %s", file_path, e)
+                    # Continue with the other files
+                    return False
+
+        results = await asyncio.gather(*(move_one(file_path) for file_path in files_to_process))
+        return all(results)
+
+    def _build_folder_lookup(self) -> FolderLookup:
+        """Build lookup structures for efficient folder matching.
+
+        Returns:
+            A tuple of (exact-match dict, list of lowercase address keys,
+            list of folder path strings parallel to the keys)
+        """
+        # Reuse the previous cycle's lookup while the destination parent's
+        # mtime is unchanged, i.e. no address folders were added or removed
+        try:
+            dest_mtime = os.stat(self.destination_parent).st_mtime_ns
+        except OSError:
+            dest_mtime = -1
+        if self._folder_lookup_cache is not None and dest_mtime == self._last_dest_mtime:
+            return self._folder_lookup_cache
+
+        folder_lookup: Dict[str, str] = {}
+
         try:
             # Count the folders for logging
             folder_count = 0
             
-            for folder in self.destination_parent.iterdir():
-                if folder.is_dir():
-                    folder_parts = folder.name.split('-')
-                    if len(folder_parts) >= 2:
-                        folder_address = folder_parts[1].strip().lower()
-                        folder_lookup[folder_address] = folder
-                        folder_count += 1
-            
-            self.logger.info(f"Built folder lookup with {folder_count} folders")
-            return folder_lookup
+            with os.scandir(self.destination_parent) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        folder_parts = entry.name.split('-')
+                        if len(folder_parts) >= 2:
+                            folder_address = folder_parts[1].strip().lower()
+                            folder_lookup[folder_address] = entry.path
+                            folder_count += 1
             
+            self.logger.info("Built folder lookup with %d folders", folder_count)
+
         except Exception as e:
-            self.logger.error(f"Error building folder lookup: {e}")
-            return {}
+            self.logger.error("Error building folder lookup: %s", e)
+            # Don't cache the failed scan; leaving the previous snapshot in
+            # place means the next cycle rebuilds instead of matching
+            # nothing until the destination's own mtime happens to change
+            return {}, [], []
+
+        # Parallel key/path lists let the partial-match scan iterate plain
+        # strings instead of unpacking dict items per file
+        lookup: FolderLookup = (folder_lookup, list(folder_lookup.keys()),
+                                list(folder_lookup.values()))
+        self._folder_lookup_cache = lookup
+        self._last_dest_mtime = dest_mtime
+        return lookup
+
+    def _find_matching_folder_from_lookup(self, address_lower: str,
+                                          folder_lookup: FolderLookup) -> Optional[str]:
+        """Find a matching folder using the lookup structures.
 
-    def _find_matching_folder_from_lookup(self, address: str, folder_lookup: Dict[str, Path]) -> Optional[Path]:
-        """Find a matching folder using the lookup dictionary.
-        
         Args:
-            address: The address to match
-            folder_lookup: Dictionary mapping addresses to folder paths
-            
+            address_lower: The address to match, already lowercased
+            folder_lookup: Lookup structures from _build_folder_lookup
+
         Returns:
-            Path to the matching folder or None if not found
+            Path string of the matching folder or None if not found
         """
         try:
-            address_lower = address.lower()
-            
+            exact, keys, paths = folder_lookup
+
             # First try exact match
-            if address_lower in folder_lookup:
-                return folder_lookup[address_lower]
-            
-            # Then try partial matches
-            for folder_address, folder_path in folder_lookup.items():
+            folder_path = exact.get(address_lower)
+            if folder_path is not None:
+                return folder_path
+
+            # Then try partial matches over the precomputed key list
+            for i, folder_address in enumerate(keys):
                 if folder_address in address_lower or address_lower in folder_address:
-                    return folder_path
-            
+                    return paths[i]
+
             return None
         except Exception as e:
-            self.logger.error(f"Error finding matching folder for address '{address}': {e}")
+            self.logger.error("Error finding matching folder for address '%s': %s", address_lower, e)
             return None
 
     def run_service_loop(self, interval_seconds: int = 60) -> None:
@@ -375,46 +677,76 @@ class FileMoverService:
         Args:
             interval_seconds: Time in seconds between processing cycles
         """
-        self.logger.info(f"Starting file mover service loop with {interval_seconds} second interval")
+        self.logger.info("Starting file mover service loop with %d second interval", interval_seconds)
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
-        
+
+        # Watch the source folder so new files are processed immediately;
+        # the polling interval remains as a fallback sweep (and as the only
+        # trigger where watchdog is unavailable, e.g. network filesystems)
+        observer = None
+        if Observer is not None:
+            try:
+                observer = Observer()
+                observer.schedule(_SourceFolderWatcher(self._wake_event), str(self.source_folder))
+                observer.start()
+                self.logger.info("Watching source folder for filesystem events")
+            except Exception as e:
+                self.logger.warning("Could not watch source folder, polling only: %s", e)
+                observer = None
+
         try:
             while self.running:
                 start_time = time.time()
-                
+
+                # Clear before scanning, not before sleeping: events that
+                # fire during the cycle stay set and skip the sleep, so
+                # files that land mid-cycle are picked up immediately
+                self._wake_event.clear()
+
                 try:
                     self.process_files()
                 except Exception as e:
-                    self.logger.error(f"Error in processing cycle: {e}")
-                
+                    self.logger.error("Error in processing cycle: %s", e)
+
                 # Calculate time to sleep
                 elapsed = time.time() - start_time
                 sleep_time = max(0, interval_seconds - elapsed)
-                
+
                 if sleep_time > 0:
-                    self.logger.debug(f"Sleeping for {sleep_time:.1f} seconds until next cycle")
-                    # Sleep in small increments to allow for responsive shutdown
-                    for _ in range(int(sleep_time)):
+                    self.logger.debug("Sleeping for %.1f seconds until next cycle", sleep_time)
+                    if observer is not None:
+                        # Wake early if new files arrive or shutdown is
+                        # signaled in the meantime
+                        self._wake_event.wait(sleep_time)
                         if not self.running:
                             break
-                        time.sleep(1)
-                    # Sleep any remaining fraction of a second
-                    if self.running and sleep_time % 1 > 0:
-                        time.sleep(sleep_time % 1)
-            
+                    else:
+                        # One kernel wait that returns immediately on shutdown,
+                        # instead of waking every second to poll the flag
+                        if self._stop_event.wait(timeout=sleep_time):
+                            break
+
             self.logger.info("Service loop stopped gracefully")
-            
+
         except Exception as e:
-            self.logger.error(f"Unexpected error in service loop: {e}")
+            self.logger.error("Unexpected error in service loop: %s", e)
             raise
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            # Drain any queued log records before the process exits
+            self._log_listener.stop()
 
     def _handle_shutdown(self, signum: int, frame: Optional[Any]) -> None:
         """Handle shutdown signals gracefully."""
-        self.logger.info(f"Received signal {signum}, shutting down...")
+        self.logger.info("Received signal %s, shutting down...", signum)
         self.running = False
+        self._stop_event.set()
+        self._wake_event.set()
 
 
 def run_service(config_path: str = "config.json") -> None:
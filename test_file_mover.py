@@ -117,6 +117,30 @@ class TestFileMoverService(unittest.TestCase):
         expected_path = self.dest_dir / self.folders[1] / "Correspondence" / self.today / f"{self.today} - 456 Oak Ave - Report.pdf"
         self.assertTrue(expected_path.exists(), f"File not found at {expected_path}")
 
+    def test_custom_subfolder_keywords(self):
+        """Test routing files via a configured keyword-to-subfolder map."""
+        # Rewrite the config with a custom keyword mapping
+        config = {
+            "source_folder": str(self.source_dir),
+            "destination_parent_folder": str(self.dest_dir),
+            "subfolder_keywords": {"Invoice": "Accounting"}
+        }
+        with open(self.config_path, 'w') as f:
+            json.dump(config, f)
+
+        # Create a test file with the configured keyword in the name
+        test_file = self.source_dir / "123 Main St - Invoice March.pdf"
+        with open(test_file, 'w') as f:
+            f.write("Test content")
+
+        # Run the service
+        service = FileMoverService(str(self.config_path))
+        service.process_files()
+
+        # Check if file was moved to the configured subfolder
+        expected_path = self.dest_dir / self.folders[0] / "Accounting" / f"{self.today} - 123 Main St - Invoice March.pdf"
+        self.assertTrue(expected_path.exists(), f"File not found at {expected_path}")
+
     def test_handle_duplicate_files(self):
         """Test handling of duplicate files."""
         # Create a test file
@@ -145,6 +169,23 @@ class TestFileMoverService(unittest.TestCase):
         self.assertTrue(original_file.exists(), f"Original file not found at {original_file}")
         self.assertTrue(duplicate_file.exists(), f"Duplicate file not found at {duplicate_file}")
 
+    def test_handle_duplicate_sparse_suffixes(self):
+        """Test duplicate numbering when existing suffixes have gaps."""
+        service = FileMoverService(str(self.config_path))
+
+        # Create existing duplicates with a gap at _3
+        base_path = self.dest_dir / self.folders[0]
+        for name in ["Document.pdf", "Document_1.pdf", "Document_2.pdf",
+                     "Document_4.pdf", "Document_5.pdf"]:
+            with open(base_path / name, 'w') as f:
+                f.write("Test content")
+
+        # The probe lands past the highest taken suffix rather than on the
+        # first free one, so interior gaps are skipped
+        new_path = service.handle_duplicate_file(base_path / "Document.pdf")
+        self.assertEqual(new_path.name, "Document_6.pdf")
+        self.assertFalse(new_path.exists(), "Chosen duplicate name should be free")
+
     def test_extract_address_edge_cases(self):
         """Test address extraction with edge cases."""
         service = FileMoverService(str(self.config_path))
@@ -160,6 +201,10 @@ class TestFileMoverService(unittest.TestCase):
         
         # Test with date-like string that isn't a valid date
         self.assertEqual(service.extract_address("9999-99-99 - address.pdf"), "address")
+
+        # Test with irregular whitespace around the date separator
+        self.assertEqual(service.extract_address("2024-01-15  - 123 Main St - Letter.pdf"), "123 Main St")
+        self.assertEqual(service.extract_address(" 2024-01-15 - 123 Main St - Letter.pdf"), "123 Main St")
         
         # Test with completely empty string
         self.assertIsNone(service.extract_address(""))